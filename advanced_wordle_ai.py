@@ -1,218 +1,246 @@
-import math
+import copy
+import hashlib
 from collections import Counter, defaultdict
+import numpy as np
 from wordle_ai_solver import load_word_list
+from wordle_kernels import ALL_GREEN, NUM_PATTERNS, POWERS_OF_THREE, decode_feedback, encode_feedback, encode_words, feedback_row, pattern_entropies, pattern_matrix, xlog2x_table
 
 class AdvancedWordleAI:
     """Advanced AI solver using information theory and entropy-based decision making."""
     
+    # Read-only tables derived from a word list, shared by every AI of the same
+    # class built on that list so constructing a new AI per game costs O(1)
+    _shared_tables = {}
+    # Number of words from the top of the word list always considered as guesses
+    candidate_pool_size = 100
+    # Ranking bonus for guesses that could themselves be the solution
+    possible_solution_bonus = 0.5
+    # Most vowels (counting y) a guess-pool word may have; None keeps every word
+    max_guess_vowels = None
+    # Above this many possible solutions, entropies are estimated from a random
+    # sample of them, seeded by the possible set so results stay reproducible
+    entropy_sample_threshold = 512
+    entropy_sample_size = 256
+    entropy_sample_seed = 0
+    # Candidates ranked per block when pruning guesses that can't beat the best
+    candidate_block_size = 64
+    # Maximum number of decisions remembered per word list
+    guess_cache_size = 100000
+    
     def __init__(self, word_list):
         self.word_list = word_list
-        self.possible_words = word_list.copy()
+        key = (type(self), tuple(word_list))
+        tables = self._shared_tables.get(key)
+        if tables is None:
+            self._calculate_shared_tables(word_list)
+            tables = {name: value for name, value in self.__dict__.items() if name != 'word_list'}
+            self._shared_tables[key] = tables
+        else:
+            self.__dict__.update(tables)
+        # Fixed list of common optimal starter words
+        self.starter_words = ['raise', 'stare', 'crane', 'slate', 'audio', 'roate', 'soare', 'arise', 'irate', 'orate', 'least', 'steal', 'tears']
+        # The first guess only depends on the word list, so decide it once up front
+        self.optimal_first_word = next((word for word in self.starter_words if word in self.word_index), word_list[0] if word_list else None)
+        self.reset()
+        
+    def reset(self):
+        """Forget all feedback so the AI can play a new game."""
+        self.possible_mask = np.ones(len(self.word_list), dtype=bool)
+        # Number of feedback rounds applied in the current game
+        self._turn = 0
+    
+    def _calculate_shared_tables(self, word_list):
+        """Calculate the word list statistics and encodings that never change during a game."""
+        # Integer encodings: word ids index rows (guesses) and columns (solutions)
+        # of the precomputed feedback code matrix
+        self.word_index = {word: i for i, word in enumerate(word_list)}
+        self.words_u8 = encode_words(word_list)
+        # (5, 26) counts of each letter code at each position
+        self.position_counts = np.stack([np.bincount(self.words_u8[:, i], minlength=26) for i in range(5)])
         self.letter_frequency = self._calculate_letter_frequency(word_list)
         self.position_frequency = self._calculate_position_frequency(word_list)
         self.word_scores = self._calculate_word_scores(word_list)
-        # Fixed list of common optimal starter words
-        self.starter_words = ['raise', 'stare', 'crane', 'slate', 'audio', 'roate', 'soare', 'arise', 'irate', 'orate', 'least', 'steal', 'tears']
-        
+        self.pattern_matrix = pattern_matrix(tuple(word_list))
+        self.top_candidate_idx = np.arange(min(self.candidate_pool_size, len(word_list)))
+        if self.max_guess_vowels is not None:
+            vowel_counts = np.isin(self.words_u8, [ord(letter) - 97 for letter in 'aeiouy']).sum(axis=1)
+            self.top_candidate_idx = self.top_candidate_idx[vowel_counts[self.top_candidate_idx] <= self.max_guess_vowels]
+        self.xlog2x = xlog2x_table(len(word_list))
+        self.guess_bonus = self._calculate_guess_bonus(word_list)
+        # Best guess found for each possible word set, keyed by the packed possible
+        # mask; as the game is replayed this fills in its decision tree
+        self.guess_cache = {}
+    
     def _calculate_letter_frequency(self, words):
         """Calculate letter frequency across all positions."""
-        frequency = {}
-        for word in words:
-            for i, letter in enumerate(word):
-                if letter not in frequency:
-                    frequency[letter] = [0] * 5
-                frequency[letter][i] += 1
-        return frequency
+        counts = self.position_counts.T
+        return {chr(code + 97): counts[code].tolist() for code in np.flatnonzero(counts.any(axis=1))}
     
     def _calculate_position_frequency(self, words):
         """Calculate letter frequency for each position specifically."""
         position_freq = [defaultdict(int) for _ in range(5)]
-        for word in words:
-            for i, letter in enumerate(word):
-                position_freq[i][letter] += 1
+        for i, counts in enumerate(self.position_counts):
+            for code in np.flatnonzero(counts):
+                position_freq[i][chr(code + 97)] = int(counts[code])
         return position_freq
     
     def _calculate_word_scores(self, words):
-        """Pre-calculate scores for all words based on multiple factors."""
-        scores = {}
-        for word in words:
-            score = 0
-            unique_letters = set(word)
-            
-            # Letter frequency score
-            for letter in unique_letters:
-                score += sum(self.letter_frequency.get(letter, [0]))
-            
-            # Position-specific frequency bonus
-            for i, letter in enumerate(word):
-                score += self.position_frequency[i].get(letter, 0) * 2
-            
-            # Unique letter bonus
-            score += len(unique_letters) * 50
-            
-            # Vowel/consonant balance bonus
-            vowels = sum(1 for letter in word if letter in 'aeiou')
-            if 1 <= vowels <= 3:  # Optimal vowel count
-                score += 100
-            
-            # Common letter combinations bonus
-            common_patterns = ['th', 'er', 'on', 'an', 're', 'he', 'in', 'ed', 'nd', 'ha']
-            for pattern in common_patterns:
-                if pattern in word:
-                    score += 20
-            
-            scores[word] = score
+        """Pre-calculate scores for all words based on multiple factors, indexed by word id."""
+        words_u8 = self.words_u8
+        # One-hot (N, 26) letter sets, so repeated letters only count once
+        letter_sets = np.zeros((len(words_u8), 26), dtype=np.int64)
+        letter_sets[np.arange(len(words_u8))[:, None], words_u8] = 1
+        
+        # Letter frequency score
+        scores = letter_sets @ self.position_counts.sum(axis=0)
+        
+        # Position-specific frequency bonus
+        scores += self.position_counts[np.arange(5), words_u8].sum(axis=1) * 2
+        
+        # Unique letter bonus
+        scores += letter_sets.sum(axis=1) * 50
+        
+        # Vowel/consonant balance bonus
+        vowels = np.isin(words_u8, [ord(letter) - 97 for letter in 'aeiou']).sum(axis=1)
+        scores += ((vowels >= 1) & (vowels <= 3)) * 100  # Optimal vowel count
+        
+        # Common letter combinations bonus, with letter pairs coded as first * 26 + second
+        common_patterns = ['th', 'er', 'on', 'an', 're', 'he', 'in', 'ed', 'nd', 'ha']
+        pairs = words_u8[:, :-1].astype(np.int64) * 26 + words_u8[:, 1:]
+        for pattern in common_patterns:
+            code = (ord(pattern[0]) - 97) * 26 + ord(pattern[1]) - 97
+            scores += (pairs == code).any(axis=1) * 20
         return scores
     
-    def _calculate_entropy(self, word, possible_words):
-        """Calculate the information entropy of a word based on possible outcomes."""
-        if not possible_words:
-            return 0
-        
-        # Simulate all possible feedback patterns for this word
-        feedback_counts = defaultdict(int)
-        
-        for solution in possible_words:
-            feedback = self._simulate_feedback(word, solution)
-            feedback_counts[feedback] += 1
-        
-        # Calculate entropy
-        entropy = 0
-        total_words = len(possible_words)
-        
-        for count in feedback_counts.values():
-            probability = count / total_words
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-        
-        return entropy
+    def _calculate_guess_bonus(self, word_list):
+        """Calculate the heuristic bonus added to each word's entropy when ranking guesses."""
+        # Bonus for high-scoring words
+        return self.word_scores / 1000
+    
+    @property
+    def possible_words(self):
+        """Words still consistent with all feedback received so far."""
+        return [self.word_list[i] for i in np.flatnonzero(self.possible_mask)]
+    
+    @possible_words.setter
+    def possible_words(self, words):
+        self.possible_mask = np.zeros(len(self.word_list), dtype=bool)
+        self.possible_mask[[self.word_index[word] for word in words]] = True
+        # An unfiltered word list means no feedback is in effect yet
+        self._turn = 0 if self.possible_mask.all() else max(self._turn, 1)
+    
+    def _possible_indices(self):
+        """Get the word ids of the current possible words."""
+        return np.flatnonzero(self.possible_mask)
+    
+    def _entropy_solutions(self, possible_idx, key):
+        """Get the solutions to measure entropy over: all possible ones, or a random sample of a large set."""
+        if len(possible_idx) > self.entropy_sample_threshold:
+            digest = hashlib.blake2b(key, digest_size=16).digest()
+            rng = np.random.default_rng([self.entropy_sample_seed, int.from_bytes(digest, 'little')])
+            return rng.choice(possible_idx, self.entropy_sample_size, replace=False)
+        return possible_idx
+    
+    def _calculate_entropies(self, candidate_idx, solution_idx):
+        """Calculate the information entropy of each candidate word over the given solutions."""
+        return pattern_entropies(self.pattern_matrix[np.ix_(candidate_idx, solution_idx)], self.xlog2x)
+    
+    def _candidate_bonuses(self, candidate_idx):
+        """Get the heuristic plus possible-solution bonus of each candidate guess."""
+        return self.guess_bonus[candidate_idx] + self.possible_solution_bonus * self.possible_mask[candidate_idx]
+    
+    def _rank_candidates(self, candidate_idx, solution_idx):
+        """Score candidate guesses by entropy plus their heuristic and possible-solution bonuses."""
+        return self._calculate_entropies(candidate_idx, solution_idx) + self._candidate_bonuses(candidate_idx)
+    
+    def _best_candidate(self, candidate_idx, possible_idx):
+        """Pick the highest ranked candidate guess and describe its score."""
+        # The candidates and any entropy sample depend only on the possible words,
+        # so the same possible set always gets the same answer
+        key = np.packbits(self.possible_mask).tobytes()
+        if key in self.guess_cache:
+            return self.guess_cache[key]
+        
+        solution_idx = self._entropy_solutions(possible_idx, key)
+        # Entropy is at most log2 of the number of distinct patterns the solutions can produce
+        upper_bounds = np.log2(min(NUM_PATTERNS, len(solution_idx))) + self._candidate_bonuses(candidate_idx)
+        order = np.argsort(-upper_bounds, kind='stable')
+        best, best_score = len(candidate_idx), -np.inf
+        
+        # Rank candidates in blocks, most promising first, until no remaining
+        # candidate's upper bound can beat the best score found
+        for start in range(0, len(order), self.candidate_block_size):
+            block = order[start:start + self.candidate_block_size]
+            if upper_bounds[block[0]] < best_score:
+                break
+            scores = self._rank_candidates(candidate_idx[block], solution_idx)
+            block_score = scores.max()
+            # Ties go to the earliest candidate, as with a plain argmax
+            block_best = int(block[scores == block_score].min())
+            if block_score > best_score or (block_score == best_score and block_best < best):
+                best, best_score = block_best, block_score
+        
+        best_word = self.word_list[candidate_idx[best]]
+        result = best_word, f"Entropy: {best_score:.3f}, Score: {self.word_scores[candidate_idx[best]]}"
+        if len(self.guess_cache) < self.guess_cache_size:
+            self.guess_cache[key] = result
+        return result
     
     def _simulate_feedback(self, guess, solution):
-        """Simulate Wordle feedback for a guess against a solution."""
-        feedback = ['B'] * 5
-        solution_counter = Counter(solution)
+        """Simulate Wordle feedback for a guess against a solution as a base-3 pattern code."""
+        tiles = [0] * 5
+        # Unused solution letter counts, indexed by letter code (a=0 ... z=25)
+        letter_counts = [0] * 26
+        for letter in solution:
+            letter_counts[ord(letter) - 97] += 1
         
         # First pass: greens
         for i in range(5):
             if guess[i] == solution[i]:
-                feedback[i] = 'G'
-                solution_counter[guess[i]] -= 1
+                tiles[i] = 2
+                letter_counts[ord(guess[i]) - 97] -= 1
         
         # Second pass: yellows
         for i in range(5):
-            if feedback[i] == 'B' and guess[i] in solution and solution_counter[guess[i]] > 0:
-                feedback[i] = 'Y'
-                solution_counter[guess[i]] -= 1
+            if tiles[i] == 0:
+                letter = ord(guess[i]) - 97
+                if letter_counts[letter] > 0:
+                    tiles[i] = 1
+                    letter_counts[letter] -= 1
         
-        return ''.join(feedback)
+        return sum(tile * power for tile, power in zip(tiles, POWERS_OF_THREE))
     
-    def _filter_words_by_feedback(self, guess, feedback):
-        """Filter possible words based on feedback using advanced logic."""
-        filtered_words = []
-        
-        for word in self.possible_words:
-            if self._word_matches_advanced_feedback(word, guess, feedback):
-                filtered_words.append(word)
-        
-        return filtered_words
+    def _feedback_codes(self, guess):
+        """Get the feedback codes of a guess against every word in the word list."""
+        if guess in self.word_index:
+            return self.pattern_matrix[self.word_index[guess]]
+        return feedback_row(encode_words([guess])[0], self.words_u8)
     
-    def _word_matches_advanced_feedback(self, word, guess, feedback):
-        """Advanced word matching with improved handling of repeated letters."""
-        # Create copies to track used letters
-        word_chars = list(word)
-        guess_chars = list(guess)
-        
-        # Track letter counts in solution
-        solution_letter_counts = Counter(word)
-        
-        # First pass: check greens (exact matches)
-        for i in range(5):
-            if feedback[i] == 'G':
-                if word[i] != guess[i]:
-                    return False
-                # Mark as used
-                word_chars[i] = None
-                guess_chars[i] = None
-                solution_letter_counts[guess[i]] -= 1
-        
-        # Second pass: check yellows and grays with improved repeated letter logic
-        for i in range(5):
-            if guess_chars[i] is None:  # Already processed
-                continue
-            
-            if feedback[i] == 'Y':
-                # Letter must be in word but not at this position
-                if guess[i] not in word_chars or solution_letter_counts[guess[i]] <= 0:
-                    return False
-                # Remove the first occurrence of this letter
-                for j in range(5):
-                    if word_chars[j] == guess[i]:
-                        word_chars[j] = None
-                        solution_letter_counts[guess[i]] -= 1
-                        break
-            elif feedback[i] == 'B':
-                # For repeated letters, be more careful
-                guess_letter = guess[i]
-                guess_count = guess.count(guess_letter)
-                
-                # Count how many of this letter we've already accounted for
-                accounted_for = 0
-                for j in range(5):
-                    if j != i and guess[j] == guess_letter:
-                        if feedback[j] in ['G', 'Y']:
-                            accounted_for += 1
-                
-                # If we have more of this letter in the guess than accounted for,
-                # and this position is black, then this letter shouldn't be in the word
-                if guess_count > accounted_for:
-                    if guess_letter in word_chars and solution_letter_counts[guess_letter] > 0:
-                        return False
-        
-        return True
+    def _filter_words_by_feedback(self, guess, feedback):
+        """Filter possible words to those that would have produced this feedback for the guess."""
+        code = encode_feedback(feedback) if isinstance(feedback, str) else int(feedback)
+        return self.possible_mask & (self._feedback_codes(guess) == code)
     
     def _get_optimal_guess(self):
         """Get the optimal guess using entropy and information theory."""
-        if not self.possible_words:
+        # For first guess, use the precomputed starter word
+        if self._turn == 0 and self.optimal_first_word:
+            if self.optimal_first_word in self.starter_words:
+                return self.optimal_first_word, f"Using starter word: {self.optimal_first_word.upper()}"
+            return self.optimal_first_word, "Fallback: first word in list"
+        
+        possible_idx = self._possible_indices()
+        if not len(possible_idx):
             return None, "No possible words remaining"
         
-        # For first guess, use the first available starter word
-        if len(self.possible_words) == len(self.word_list):
-            for word in self.starter_words:
-                if word in self.word_list and word in self.possible_words:
-                    return word, f"Using starter word: {word.upper()}"
-            # Fallback if none found
-            return self.possible_words[0], "Fallback: first word in list"
-        
         # If we have very few possible words, pick the best one
-        if len(self.possible_words) <= 3:
-            best_word = max(self.possible_words, key=lambda w: self.word_scores.get(w, 0))
-            return best_word, f"Only {len(self.possible_words)} possible words remaining"
+        if len(possible_idx) <= 3:
+            best_word = self.word_list[possible_idx[np.argmax(self.word_scores[possible_idx])]]
+            return best_word, f"Only {len(possible_idx)} possible words remaining"
         
-        # Calculate entropy for all possible guesses
-        best_entropy = -1
-        best_word = None
-        best_reasoning = ""
-        
-        # Consider both possible solutions and good guess words
-        candidate_words = list(set(self.possible_words + self.word_list[:100]))  # Top 100 words as candidates
-        
-        for word in candidate_words:
-            entropy = self._calculate_entropy(word, self.possible_words)
-            
-            # Bonus for words that are possible solutions
-            if word in self.possible_words:
-                entropy += 0.5
-            
-            # Bonus for high-scoring words
-            score_bonus = self.word_scores.get(word, 0) / 1000
-            entropy += score_bonus
-            
-            if entropy > best_entropy:
-                best_entropy = entropy
-                best_word = word
-                best_reasoning = f"Entropy: {entropy:.3f}, Score: {self.word_scores.get(word, 0)}"
-        
-        return best_word, best_reasoning
+        # Rank both possible solutions and good guess words
+        candidate_idx = np.union1d(possible_idx, self.top_candidate_idx)
+        return self._best_candidate(candidate_idx, possible_idx)
     
     def get_best_guess(self):
         """Get the best guess using advanced AI logic."""
@@ -226,7 +254,7 @@ class AdvancedWordleAI:
         reasoning_parts = [
             f"Chose '{guess.upper()}' with {len(unique_letters)} unique letters",
             f"Information gain: {reasoning}",
-            f"Eliminates from {len(self.possible_words)} possible words"
+            f"Eliminates from {int(self.possible_mask.sum())} possible words"
         ]
         
         # Add position-specific reasoning
@@ -239,21 +267,46 @@ class AdvancedWordleAI:
         return guess, " | ".join(reasoning_parts)
     
     def update_with_feedback(self, guess, feedback):
-        """Update AI state with new guess and feedback."""
-        remaining_count = len(self.possible_words)
-        self.possible_words = self._filter_words_by_feedback(guess, feedback)
-        new_count = len(self.possible_words)
+        """Update AI state with new guess and feedback ('GYB' string or base-3 pattern code)."""
+        remaining_count = int(self.possible_mask.sum())
+        self.possible_mask = self._filter_words_by_feedback(guess, feedback)
+        self._turn += 1
+        new_count = int(self.possible_mask.sum())
         
         return f"Filtered from {remaining_count} to {new_count} possible words"
+    
+    def prefetch_guesses(self, guess, max_branches=8):
+        """Decide the next guess for the most likely feedback to guess ahead of time, filling the guess cache."""
+        if guess not in self.word_index:
+            return
+        possible_idx = self._possible_indices()
+        codes = self.pattern_matrix[self.word_index[guess], possible_idx]
+        counts = np.bincount(codes, minlength=NUM_PATTERNS)
+        counts[ALL_GREEN] = 0
+        
+        # Decisions only depend on the possible words, so a copy of this AI
+        # playing out each branch leaves answers the real game can reuse
+        branch = copy.copy(self)
+        branch._turn = self._turn + 1
+        for code in np.argsort(-counts, kind='stable')[:max_branches]:
+            if not counts[code]:
+                break
+            branch.possible_mask = np.zeros_like(self.possible_mask)
+            branch.possible_mask[possible_idx[codes == code]] = True
+            branch._get_optimal_guess()
 
 class OptimizedWordleAI(AdvancedWordleAI):
     """Further optimized AI with additional heuristics."""
     
-    def __init__(self, word_list):
-        super().__init__(word_list)
+    candidate_pool_size = 200
+    possible_solution_bonus = 1.0
+    
+    def _calculate_shared_tables(self, word_list):
+        """Calculate the heuristics used by the optimized scoring plus the base tables."""
         self.common_words = self._identify_common_words()
         self.letter_combinations = self._analyze_letter_combinations()
         self.repeated_letter_patterns = self._analyze_repeated_letter_patterns()
+        super()._calculate_shared_tables(word_list)
     
     def _identify_common_words(self):
         """Identify commonly used words for better first guesses."""
@@ -277,79 +330,56 @@ class OptimizedWordleAI(AdvancedWordleAI):
         """Analyze patterns of repeated letters in the word list."""
         patterns = defaultdict(int)
         for word in self.word_list:
-            letter_counts = Counter(word)
-            # Create pattern of repeated letters
-            pattern = []
-            for letter, count in letter_counts.items():
-                if count > 1:
-                    pattern.append(f"{letter}{count}")
-            if pattern:
-                pattern_str = "".join(sorted(pattern))
+            pattern_str = self._repeated_letter_pattern(word)
+            if pattern_str:
                 patterns[pattern_str] += 1
         return patterns
     
+    def _repeated_letter_pattern(self, word):
+        """Describe a word's repeated letters, e.g. 'e3' for 'eerie', or '' if none repeat."""
+        letter_counts = Counter(word)
+        pattern = [f"{letter}{count}" for letter, count in letter_counts.items() if count > 1]
+        return "".join(sorted(pattern))
+    
+    def _calculate_guess_bonus(self, word_list):
+        """Combine the score, letter combination and repeated letter bonuses of each word."""
+        # Bonus for high-scoring words
+        bonus = self.word_scores / 2000
+        
+        # Bonus for common letter combinations, with letter pairs coded as first * 26 + second
+        pairs = self.words_u8[:, :-1].astype(np.int64) * 26 + self.words_u8[:, 1:]
+        pair_counts = np.bincount(pairs.ravel(), minlength=26 * 26)
+        bonus += pair_counts[pairs].sum(axis=1) / 1000
+        
+        for i, word in enumerate(word_list):
+            # Bonus for words that handle repeated letters well: if this
+            # pattern is common in solutions, it's good
+            pattern_str = self._repeated_letter_pattern(word)
+            if pattern_str in self.repeated_letter_patterns:
+                bonus[i] += self.repeated_letter_patterns[pattern_str] / 100
+        return bonus
+    
     def _get_optimal_guess(self):
         """Enhanced optimal guess selection with additional heuristics."""
-        if not self.possible_words:
+        # For first guess, use the precomputed starter word
+        if self._turn == 0 and self.optimal_first_word:
+            if self.optimal_first_word in self.starter_words:
+                return self.optimal_first_word, f"Using starter word: {self.optimal_first_word.upper()}"
+            return self.optimal_first_word, "Fallback: first word in list"
+        
+        possible_idx = self._possible_indices()
+        if not len(possible_idx):
             return None, "No possible words remaining"
         
-        # For first guess, use the first available starter word
-        if len(self.possible_words) == len(self.word_list):
-            for word in self.starter_words:
-                if word in self.word_list and word in self.possible_words:
-                    return word, f"Using starter word: {word.upper()}"
-            # Fallback if none found
-            return self.possible_words[0], "Fallback: first word in list"
-        
         # If we have very few possible words, pick the best one
-        if len(self.possible_words) <= 2:
-            best_word = max(self.possible_words, key=lambda w: self.word_scores.get(w, 0))
-            return best_word, f"Only {len(self.possible_words)} possible words remaining"
-        
-        # Calculate entropy with additional heuristics
-        best_entropy = -1
-        best_word = None
-        best_reasoning = ""
-        
-        # Consider possible solutions first, then good guess words
-        candidate_words = list(self.possible_words) + [w for w in self.word_list[:200] if w not in self.possible_words]
-        
-        for word in candidate_words:
-            entropy = self._calculate_entropy(word, self.possible_words)
-            
-            # Bonus for possible solutions
-            if word in self.possible_words:
-                entropy += 1.0
-            
-            # Bonus for high-scoring words
-            score_bonus = self.word_scores.get(word, 0) / 2000
-            entropy += score_bonus
-            
-            # Bonus for common letter combinations
-            combo_bonus = 0
-            for i in range(4):
-                combo = word[i:i+2]
-                combo_bonus += self.letter_combinations.get(combo, 0) / 1000
-            entropy += combo_bonus
-            
-            # Bonus for words that handle repeated letters well
-            letter_counts = Counter(word)
-            repeated_letters = [letter for letter, count in letter_counts.items() if count > 1]
-            if repeated_letters:
-                # If this pattern is common in solutions, it's good
-                pattern = []
-                for letter in repeated_letters:
-                    pattern.append(f"{letter}{letter_counts[letter]}")
-                pattern_str = "".join(sorted(pattern))
-                if pattern_str in self.repeated_letter_patterns:
-                    entropy += self.repeated_letter_patterns[pattern_str] / 100
-            
-            if entropy > best_entropy:
-                best_entropy = entropy
-                best_word = word
-                best_reasoning = f"Entropy: {entropy:.3f}, Score: {self.word_scores.get(word, 0)}"
-        
-        return best_word, best_reasoning
+        if len(possible_idx) <= 2:
+            best_word = self.word_list[possible_idx[np.argmax(self.word_scores[possible_idx])]]
+            return best_word, f"Only {len(possible_idx)} possible words remaining"
+        
+        # Rank possible solutions first, then good guess words
+        top_idx = self.top_candidate_idx
+        candidate_idx = np.concatenate([possible_idx, top_idx[~self.possible_mask[top_idx]]])
+        return self._best_candidate(candidate_idx, possible_idx)
 
 def test_advanced_ai():
     """Test the advanced AI performance."""
@@ -365,7 +395,7 @@ def test_advanced_ai():
         print(f"\nTesting solution: {word.upper()}")
         
         # Reset AI
-        ai.possible_words = word_list.copy()
+        ai.reset()
         
         attempts = 0
         while attempts < 6:
@@ -377,7 +407,7 @@ def test_advanced_ai():
             
             # Simulate feedback
             feedback = ai._simulate_feedback(guess, word)
-            print(f"  Feedback: {feedback}")
+            print(f"  Feedback: {decode_feedback(feedback)}")
             
             ai.update_with_feedback(guess, feedback)
             attempts += 1
@@ -0,0 +1,46 @@
+"""Worker process helpers shared by the parallel AI performance tests."""
+
+from wordle_ai_solver import WordleGame
+
+# Game and AI owned by each worker process of a parallel performance run
+_worker_state = {}
+
+def init_worker(word_list, ai_class, guess_kwargs=None):
+    """Build the game and AI a worker process reuses for every test word."""
+    _worker_state['game'] = WordleGame(word_list)
+    _worker_state['ai'] = ai_class(word_list)
+    _worker_state['guess_kwargs'] = guess_kwargs or {}
+
+def play_one(solution):
+    """Play one game against solution in a worker process, returning (solved, attempts, moves, error)."""
+    game = _worker_state['game']
+    ai = _worker_state['ai']
+    game.reset(solution)
+    ai.reset()
+    
+    attempts_made = 0
+    moves = []
+    
+    while not game.is_over() and attempts_made < 6:
+        # Get AI's best guess; nobody reads the reasoning here
+        guess, _ = ai.get_best_guess(**_worker_state['guess_kwargs'])
+        
+        if not guess:
+            return False, attempts_made, moves, f"AI cannot find valid guess after {attempts_made} attempts"
+        
+        # Make the guess
+        feedback, error = game.guess(guess)
+        if error:
+            return False, attempts_made, moves, f"Error making guess: {error}"
+        
+        attempts_made += 1
+        moves.append((guess, feedback))
+        
+        # Update AI with feedback
+        ai.update_with_feedback(guess, feedback)
+        
+        # Check if solved
+        if game.solved:
+            return True, attempts_made, moves, None
+    
+    return False, attempts_made, moves, None
@@ -1,8 +1,10 @@
+import os
 import time
 import random
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from wordle_ai_solver import load_word_list, WordleGame, WordleAI
 from advanced_wordle_ai import OptimizedWordleAI
+from ai_test_workers import init_worker, play_one
 
 def compare_ai_performance(num_words=1000):
     """Compare original AI vs advanced AI performance."""
@@ -51,77 +53,49 @@ def compare_ai_performance(num_words=1000):
 
 def test_ai_performance_detailed(test_words, ai_class, ai_name):
     """Test a specific AI class and return detailed statistics."""
+    # Solved games take 1-6 attempts, so both per-attempt tables are indexed by attempt count
     stats = {
         'total_words': len(test_words),
         'solved': 0,
         'failed': 0,
-        'attempts_distribution': defaultdict(int),
+        'attempts_distribution': [0] * 7,
         'avg_attempts': 0,
         'max_attempts': 0,
         'min_attempts': float('inf'),
         'failed_words': [],
-        'performance_by_attempts': defaultdict(list)
+        'performance_by_attempts': [[] for _ in range(7)]
     }
     
     start_time = time.time()
     
-    for i, solution in enumerate(test_words, 1):
-        if i % 50 == 0:
-            print(f"  Progress: {i}/{len(test_words)}")
-        
-        # Create game with specific solution
-        game = WordleGame(test_words)
-        game.solution = solution
+    # Games are independent, so play them across worker processes that each
+    # build one game and one AI up front
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker, initargs=(test_words, ai_class)) as executor:
+        results = executor.map(play_one, test_words, chunksize=16)
         
-        # Create AI
-        ai = ai_class(test_words)
-        
-        # Play the game
-        attempts_made = 0
-        solved = False
-        
-        while not game.is_over() and attempts_made < 6:
-            # Get AI's best guess
-            guess, reasoning = ai.get_best_guess()
-            
-            if not guess:
-                break
-            
-            # Make the guess
-            feedback, error = game.guess(guess)
-            if error:
-                break
-            
-            attempts_made += 1
+        for i, (solution, (solved, attempts_made, _, _)) in enumerate(zip(test_words, results), 1):
+            if i % 50 == 0:
+                print(f"  Progress: {i}/{len(test_words)}")
             
-            # Update AI with feedback
-            ai.update_with_feedback(guess, feedback)
-            
-            # Check if solved
-            if game.solved:
-                solved = True
-                break
-        
-        # Record results
-        if solved:
-            stats['solved'] += 1
-            stats['attempts_distribution'][attempts_made] += 1
-            stats['performance_by_attempts'][attempts_made].append(solution)
-            
-            if attempts_made < stats['min_attempts']:
-                stats['min_attempts'] = attempts_made
-            if attempts_made > stats['max_attempts']:
-                stats['max_attempts'] = attempts_made
-        else:
-            stats['failed'] += 1
-            stats['failed_words'].append(solution)
+            # Record results
+            if solved:
+                stats['solved'] += 1
+                stats['attempts_distribution'][attempts_made] += 1
+                stats['performance_by_attempts'][attempts_made].append(solution)
+            else:
+                stats['failed'] += 1
+                stats['failed_words'].append(solution)
     
     # Calculate final statistics
     end_time = time.time()
     total_time = end_time - start_time
     
     if stats['solved'] > 0:
-        total_attempts = sum(attempts * count for attempts, count in stats['attempts_distribution'].items())
+        distribution = stats['attempts_distribution']
+        used_attempts = [attempts for attempts, count in enumerate(distribution) if count]
+        stats['min_attempts'] = used_attempts[0]
+        stats['max_attempts'] = used_attempts[-1]
+        total_attempts = sum(attempts * count for attempts, count in enumerate(distribution))
         stats['avg_attempts'] = total_attempts / stats['solved']
     
     # Print detailed results
@@ -146,8 +120,9 @@ def print_detailed_performance_report(stats, total_time, ai_name):
         print(f"  Maximum Attempts: {stats['max_attempts']}")
         
         print(f"\nAttempts Distribution:")
-        for attempts in sorted(stats['attempts_distribution'].keys()):
-            count = stats['attempts_distribution'][attempts]
+        for attempts, count in enumerate(stats['attempts_distribution']):
+            if not count:
+                continue
             percentage = (count / stats['solved']) * 100
             print(f"  {attempts} attempts: {count} words ({percentage:.1f}%)")
     
@@ -159,8 +134,9 @@ def print_detailed_performance_report(stats, total_time, ai_name):
             print(f"  ... and {len(stats['failed_words']) - 10} more")
     
     print(f"\nPerformance by Attempts:")
-    for attempts in sorted(stats['performance_by_attempts'].keys()):
-        words = stats['performance_by_attempts'][attempts]
+    for attempts, words in enumerate(stats['performance_by_attempts']):
+        if not words:
+            continue
         print(f"  {attempts} attempts: {', '.join(words[:5])}{'...' if len(words) > 5 else ''}")
     
     print(f"\nTotal Test Time: {total_time:.2f} seconds")
@@ -173,26 +149,29 @@ def test_ai_performance(test_words, ai_class, ai_name):
         'total_words': len(test_words),
         'solved': 0,
         'failed': 0,
-        'attempts_distribution': defaultdict(int),
+        'attempts_distribution': [0] * 7,
         'avg_attempts': 0,
         'max_attempts': 0,
         'min_attempts': float('inf'),
         'failed_words': [],
-        'performance_by_attempts': defaultdict(list)
+        'performance_by_attempts': [[] for _ in range(7)]
     }
     
     start_time = time.time()
     
+    # One game and one AI are reused across all test words
+    game = WordleGame(test_words)
+    ai = ai_class(test_words)
+    
     for i, solution in enumerate(test_words, 1):
         if i % 10 == 0:
             print(f"  Progress: {i}/{len(test_words)}")
         
-        # Create game with specific solution
-        game = WordleGame(test_words)
-        game.solution = solution
+        # Reset game with specific solution
+        game.reset(solution)
         
-        # Create AI
-        ai = ai_class(test_words)
+        # Reset AI
+        ai.reset()
         
         # Play the game
         attempts_made = 0
@@ -225,11 +204,6 @@ def test_ai_performance(test_words, ai_class, ai_name):
             stats['solved'] += 1
             stats['attempts_distribution'][attempts_made] += 1
             stats['performance_by_attempts'][attempts_made].append(solution)
-            
-            if attempts_made < stats['min_attempts']:
-                stats['min_attempts'] = attempts_made
-            if attempts_made > stats['max_attempts']:
-                stats['max_attempts'] = attempts_made
         else:
             stats['failed'] += 1
             stats['failed_words'].append(solution)
@@ -239,7 +213,11 @@ def test_ai_performance(test_words, ai_class, ai_name):
     total_time = end_time - start_time
     
     if stats['solved'] > 0:
-        total_attempts = sum(attempts * count for attempts, count in stats['attempts_distribution'].items())
+        distribution = stats['attempts_distribution']
+        used_attempts = [attempts for attempts, count in enumerate(distribution) if count]
+        stats['min_attempts'] = used_attempts[0]
+        stats['max_attempts'] = used_attempts[-1]
+        total_attempts = sum(attempts * count for attempts, count in enumerate(distribution))
         stats['avg_attempts'] = total_attempts / stats['solved']
     
     # Print results
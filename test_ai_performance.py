@@ -1,12 +1,22 @@
+import os
+import tempfile
 import unittest
 import random
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from wordle_ai_solver import load_word_list, WordleGame, WordleAI
+import numpy as np
+import wordle_kernels
+from ai_test_workers import init_worker, play_one
+from wordle_kernels import ALL_GREEN, build_pattern_matrix, decode_feedback, encode_feedback, encode_words, feedback_row, pattern_matrix
 
 class TestAIPerformance(unittest.TestCase):
     """Test suite for AI performance across multiple words."""
     
+    # Print every guess of every game instead of just progress and the final report
+    verbose = False
+    
     @classmethod
     def setUpClass(cls):
         """Load word list once for all tests."""
@@ -37,61 +47,41 @@ class TestAIPerformance(unittest.TestCase):
         
         start_time = time.time()
         
-        for i, solution in enumerate(test_words, 1):
-            print(f"\nTest {i}/100: Testing word '{solution.upper()}'")
-            
-            # Create game with specific solution
-            game = WordleGame(self.word_list)
-            game.solution = solution  # Override random selection
-            
-            # Create AI
-            ai = WordleAI(self.word_list)
-            
-            # Play the game
-            attempts_made = 0
-            solved = False
-            
-            while not game.is_over() and attempts_made < 6:
-                # Get AI's best guess
-                guess, reasoning = ai.get_best_guess()
-                
-                if not guess:
-                    print(f"  ❌ AI cannot find valid guess after {attempts_made} attempts")
-                    break
-                
-                # Make the guess
-                feedback, error = game.guess(guess)
-                if error:
-                    print(f"  ❌ Error making guess: {error}")
-                    break
-                
-                attempts_made += 1
-                print(f"  Attempt {attempts_made}: {guess.upper()} -> {feedback} | {reasoning}")
-                
-                # Update AI with feedback
-                ai.update_with_feedback(guess, feedback)
-                
-                # Check if solved
-                if game.solved:
-                    solved = True
-                    break
+        # Games are independent, so play them across worker processes; building
+        # one AI first lets forked workers inherit the precomputed tables
+        WordleAI(self.word_list)
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker, initargs=(self.word_list, WordleAI, {'verbose': False})) as executor:
+            results = executor.map(play_one, test_words, chunksize=16)
             
-            # Record results
-            if solved:
-                stats['solved'] += 1
-                stats['attempts_distribution'][attempts_made] += 1
-                stats['performance_by_attempts'][attempts_made].append(solution)
+            for i, (solution, (solved, attempts_made, moves, error)) in enumerate(zip(test_words, results), 1):
+                if self.verbose:
+                    print(f"\nTest {i}/100: Testing word '{solution.upper()}'")
+                    
+                    for attempt, (guess, feedback) in enumerate(moves, 1):
+                        print(f"  Attempt {attempt}: {guess.upper()} -> {feedback}")
+                    if error:
+                        print(f"  ❌ {error}")
+                elif i % 100 == 0:
+                    print(f"  Progress: {i}/{len(test_words)}")
                 
-                if attempts_made < stats['min_attempts']:
-                    stats['min_attempts'] = attempts_made
-                if attempts_made > stats['max_attempts']:
-                    stats['max_attempts'] = attempts_made
-                
-                print(f"  ✅ SOLVED in {attempts_made} attempts!")
-            else:
-                stats['failed'] += 1
-                stats['failed_words'].append(solution)
-                print(f"  ❌ FAILED to solve '{solution.upper()}'")
+                # Record results
+                if solved:
+                    stats['solved'] += 1
+                    stats['attempts_distribution'][attempts_made] += 1
+                    stats['performance_by_attempts'][attempts_made].append(solution)
+                    
+                    if attempts_made < stats['min_attempts']:
+                        stats['min_attempts'] = attempts_made
+                    if attempts_made > stats['max_attempts']:
+                        stats['max_attempts'] = attempts_made
+                    
+                    if self.verbose:
+                        print(f"  ✅ SOLVED in {attempts_made} attempts!")
+                else:
+                    stats['failed'] += 1
+                    stats['failed_words'].append(solution)
+                    if self.verbose:
+                        print(f"  ❌ FAILED to solve '{solution.upper()}'")
         
         # Calculate final statistics
         end_time = time.time()
@@ -226,6 +216,28 @@ class TestAILogic(unittest.TestCase):
         for word in ai.possible_words:
             self.assertTrue(word.startswith("st"))
     
+    def test_repeated_letter_filtering(self):
+        """Test that a guess with repeated letters only keeps words matching the game's feedback."""
+        ai = WordleAI(self.word_list)
+        game = WordleGame(self.word_list)
+        game.solution = "their"
+        
+        # Only one of the three e's can be marked, so the others come back black
+        feedback = game._generate_feedback("geese")
+        self.assertEqual(feedback, "BBGBB")
+        ai.update_with_feedback("geese", feedback)
+        
+        expected = []
+        for word in self.word_list:
+            game.solution = word
+            if game._generate_feedback("geese") == feedback:
+                expected.append(word)
+        self.assertIn("their", ai.possible_words)
+        self.assertEqual(ai.possible_words, expected)
+        for word in ai.possible_words:
+            self.assertEqual(word[2], "e")
+            self.assertEqual(word.count("e"), 1)
+    
     def test_frequency_calculation(self):
         """Test that letter frequency is calculated correctly."""
         ai = WordleAI(self.word_list)
@@ -251,6 +263,84 @@ class TestAILogic(unittest.TestCase):
         self.assertEqual(len(guess), 5)
         self.assertIn("Chose", reasoning)
 
+class TestFeedbackEncoding(unittest.TestCase):
+    """Test the integer word and feedback encodings."""
+    
+    def test_feedback_round_trip(self):
+        """Test that feedback strings survive encoding and decoding."""
+        for feedback in ["BBBBB", "GGGGG", "GYBYG", "YBBGB"]:
+            self.assertEqual(decode_feedback(encode_feedback(feedback)), feedback)
+        self.assertEqual(encode_feedback("GGGGG"), ALL_GREEN)
+    
+    def test_feedback_row_repeated_letters(self):
+        """Test that vectorized feedback handles repeated letters like the game does."""
+        solutions = ["eerie", "abbey", "seeds", "crane"]
+        codes = feedback_row(encode_words(["geese"])[0], encode_words(solutions))
+        
+        for solution, code in zip(solutions, codes):
+            game = WordleGame(solutions)
+            game.solution = solution
+            self.assertEqual(decode_feedback(code), game._generate_feedback("geese"))
+
+class TestWordListLoading(unittest.TestCase):
+    """Test reading word list files."""
+    
+    def write_word_file(self, text):
+        """Write text to a temporary word list file and return its path."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, newline="") as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+    
+    def test_well_formed_file(self):
+        """Test that a file of one five-letter word per line loads as is."""
+        path = self.write_word_file("crane\r\nSLATE\r\ngeese")
+        self.assertEqual(load_word_list(path), ["crane", "slate", "geese"])
+    
+    def test_malformed_file_falls_back(self):
+        """Test that lines that aren't five letters are skipped."""
+        path = self.write_word_file("crane\nab\n  slate  \ntoolong\n\ngeese\n")
+        self.assertEqual(load_word_list(path), ["crane", "slate", "geese"])
+    
+    def test_short_file(self):
+        """Test that a file without any five-letter words loads as an empty list."""
+        self.assertEqual(load_word_list(self.write_word_file("abc")), [])
+
+class TestPatternMatrixCache(unittest.TestCase):
+    """Test saving and loading the feedback code matrix."""
+    
+    def setUp(self):
+        """Point the pattern cache at a temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        original_dir = wordle_kernels.PATTERN_CACHE_DIR
+        wordle_kernels.PATTERN_CACHE_DIR = temp_dir.name
+        self.addCleanup(setattr, wordle_kernels, "PATTERN_CACHE_DIR", original_dir)
+        pattern_matrix.cache_clear()
+        self.addCleanup(pattern_matrix.cache_clear)
+        self.words = ("crane", "geese", "eerie", "abbey", "seeds")
+    
+    def test_round_trip(self):
+        """Test that a saved matrix loads back equal to a freshly built one."""
+        expected = build_pattern_matrix(encode_words(self.words))
+        np.testing.assert_array_equal(pattern_matrix(self.words), expected)
+        self.assertEqual(len(os.listdir(wordle_kernels.PATTERN_CACHE_DIR)), 1)
+        
+        pattern_matrix.cache_clear()
+        loaded = pattern_matrix(self.words)
+        self.assertIsInstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, expected)
+    
+    def test_mismatched_file_is_rebuilt(self):
+        """Test that a cached matrix of the wrong shape is replaced."""
+        pattern_matrix(self.words)
+        path = os.path.join(wordle_kernels.PATTERN_CACHE_DIR, os.listdir(wordle_kernels.PATTERN_CACHE_DIR)[0])
+        np.save(path, np.zeros((2, 2), dtype=np.uint8))
+        
+        pattern_matrix.cache_clear()
+        np.testing.assert_array_equal(pattern_matrix(self.words), build_pattern_matrix(encode_words(self.words)))
+        self.assertEqual(np.load(path).shape, (5, 5))
+
 def run_performance_test():
     """Run the performance test standalone."""
     print("Running AI Performance Test...")
@@ -1,6 +1,9 @@
+import hashlib
 import os
 import random
-from collections import Counter
+from functools import lru_cache
+import numpy as np
+from wordle_kernels import encode_feedback, encode_words, filter_mask, pattern_entropies, pattern_matrix, xlog2x_table
 
 # ANSI color codes for better UI
 class Colors:
@@ -20,6 +23,19 @@ def load_word_list(path=WORD_LIST_PATH):
     """Load all five-letter words from the given file into a list."""
     if not os.path.exists(path):
         raise FileNotFoundError(f"Word list file not found: {path}")
+    # Fast path: a file of one five-letter word per line is read as a single
+    # byte buffer and checked with a few array operations
+    buffer = np.fromfile(path, dtype=np.uint8)
+    buffer = buffer[buffer != ord('\r')]
+    if len(buffer) and buffer[-1] != ord('\n'):
+        buffer = np.append(buffer, np.uint8(ord('\n')))
+    if len(buffer) % 6 == 0:
+        rows = buffer.reshape(-1, 6)
+        letters = rows[:, :5] | 0x20  # lowercase
+        if np.all(rows[:, 5] == ord('\n')) and np.all((letters >= ord('a')) & (letters <= ord('z'))):
+            text = letters.tobytes().decode("ascii")
+            return [text[i:i + 5] for i in range(0, len(text), 5)]
+    # Anything else is read line by line, skipping lines that aren't five letters long
     with open(path, "r") as f:
         words = [line.strip().lower() for line in f if len(line.strip()) == 5]
     return words
@@ -27,12 +43,29 @@ def load_word_list(path=WORD_LIST_PATH):
 class WordleGame:
     def __init__(self, word_list):
         self.word_list = word_list
-        self.solution = random.choice(self.word_list)
         self.max_attempts = 6
+        self.reset()
+
+    def reset(self, solution=None):
+        """Start a new game with the given solution, or a random one."""
+        self.solution = solution if solution is not None else random.choice(self.word_list)
         self.attempts = []
         self.solved = False
         self.start_time = None
 
+    @property
+    def solution(self):
+        """The word being guessed."""
+        return self._solution
+
+    @solution.setter
+    def solution(self, word):
+        self._solution = word
+        # Letter counts of the solution, indexed by letter code (a=0 ... z=25)
+        self._solution_counts = bytearray(26)
+        for letter in word:
+            self._solution_counts[ord(letter) - 97] += 1
+
     def guess(self, word):
         word = word.lower()
         if len(word) != 5 or word not in self.word_list:
@@ -46,17 +79,20 @@ class WordleGame:
     def _generate_feedback(self, guess):
         # Feedback: 'G' = green, 'Y' = yellow, 'B' = black/gray
         feedback = ['B'] * 5
-        solution_counter = Counter(self.solution)
+        solution = self._solution
+        counts = bytearray(self._solution_counts)
         # First pass: greens
         for i in range(5):
-            if guess[i] == self.solution[i]:
+            if guess[i] == solution[i]:
                 feedback[i] = 'G'
-                solution_counter[guess[i]] -= 1
+                counts[ord(guess[i]) - 97] -= 1
         # Second pass: yellows
         for i in range(5):
-            if feedback[i] == 'B' and guess[i] in self.solution and solution_counter[guess[i]] > 0:
-                feedback[i] = 'Y'
-                solution_counter[guess[i]] -= 1
+            if feedback[i] == 'B':
+                letter = ord(guess[i]) - 97
+                if counts[letter] > 0:
+                    feedback[i] = 'Y'
+                    counts[letter] -= 1
         return ''.join(feedback)
 
     def is_over(self):
@@ -91,111 +127,158 @@ class WordleGame:
         elif self.is_over():
             print(f"{Colors.GRAY}Game Over. The word was: {Colors.BOLD}{self.solution.upper()}{Colors.RESET}")
 
+@lru_cache(maxsize=8)
+def _precompute(words):
+    """Build the read-only tables shared by every WordleAI on a tuple of words."""
+    words_u8 = encode_words(words)
+    words_u8.flags.writeable = False
+    # Total occurrences of each letter code across all positions
+    letter_totals = np.bincount(words_u8.ravel(), minlength=26)
+    letter_totals.flags.writeable = False
+    return {
+        'words_u8': words_u8,
+        'word_index': {word: i for i, word in enumerate(words)},
+        'letter_frequency': WordleAI._calculate_letter_frequency(words),
+        'letter_totals': letter_totals,
+        'word_scores': WordleAI._calculate_word_scores(words_u8, letter_totals),
+        # Feedback code of every guess (row) against every solution (column)
+        'pattern_matrix': pattern_matrix(words),
+        'xlog2x': xlog2x_table(len(words)),
+        # Word ids of the full list consistent with each (guess, feedback code) seen so far
+        'survivor_cache': {},
+        # Ranked guesses for each possible word set, keyed by a digest of the alive ids
+        'decision_cache': {},
+    }
+
 class WordleAI:
+    # Maximum number of (guess, feedback) filter results remembered per word list
+    survivor_cache_size = 200000
+    # Maximum number of best-guess decisions remembered per word list
+    decision_cache_size = 50000
+    
     def __init__(self, word_list):
         self.word_list = word_list
-        self.possible_words = word_list.copy()
-        self.letter_frequency = self._calculate_letter_frequency(word_list)
+        # Word list statistics never change, so every AI on the same list shares them
+        self.__dict__.update(_precompute(tuple(word_list)))
+        self.reset()
         
-    def _calculate_letter_frequency(self, words):
+    def reset(self):
+        """Forget all feedback so the AI can play a new game."""
+        # Word ids of the words still consistent with all feedback
+        self.alive = np.arange(len(self.word_list))
+    
+    @property
+    def possible_words(self):
+        """Words still consistent with all feedback received so far."""
+        return [self.word_list[i] for i in self.alive]
+    
+    @possible_words.setter
+    def possible_words(self, words):
+        word_set = set(words)
+        self.alive = np.array([i for i, word in enumerate(self.word_list) if word in word_set], dtype=np.int64)
+    
+    @staticmethod
+    def _calculate_letter_frequency(words):
         """Calculate letter frequency across all positions in the word list."""
-        frequency = {}
-        for word in words:
-            for i, letter in enumerate(word):
-                if letter not in frequency:
-                    frequency[letter] = [0] * 5
-                frequency[letter][i] += 1
-        return frequency
+        words_u8 = encode_words(words)
+        # (26, 5) counts of each letter code at each position
+        counts = np.stack([np.bincount(words_u8[:, i], minlength=26) for i in range(5)], axis=1)
+        return {chr(code + 97): counts[code].tolist() for code in np.flatnonzero(counts.any(axis=1))}
     
     def _filter_words(self, guess, feedback):
-        """Filter possible words based on the guess and feedback."""
-        filtered_words = []
-        
-        for word in self.possible_words:
-            if self._word_matches_feedback(word, guess, feedback):
-                filtered_words.append(word)
-        
-        self.possible_words = filtered_words
-        return filtered_words
+        """Filter possible words based on the guess and feedback, returning the words still possible."""
+        self._filter_ids(guess, feedback)
+        return self.possible_words
     
-    def _word_matches_feedback(self, word, guess, feedback):
-        """Check if a word matches the feedback from a guess."""
-        # Create a copy of the word to track used letters
-        word_chars = list(word)
-        guess_chars = list(guess)
-        
-        # First pass: check greens (exact matches)
-        for i in range(5):
-            if feedback[i] == 'G':
-                if word[i] != guess[i]:
-                    return False
-                # Mark as used
-                word_chars[i] = None
-                guess_chars[i] = None
-        
-        # Second pass: check yellows and grays
-        for i in range(5):
-            if guess_chars[i] is None:  # Already processed
-                continue
-                
-            if feedback[i] == 'Y':
-                # Letter must be in word but not at this position
-                if guess[i] not in word_chars:
-                    return False
-                # Remove the first occurrence of this letter
-                for j in range(5):
-                    if word_chars[j] == guess[i]:
-                        word_chars[j] = None
-                        break
-            elif feedback[i] == 'B':
-                # Letter should not be in word (unless it's a yellow elsewhere)
-                if guess[i] in word_chars:
-                    return False
-        
-        return True
+    def _filter_ids(self, guess, feedback):
+        """Filter the alive ids based on the guess and feedback ('GYB' string or base-3 pattern code)."""
+        if isinstance(feedback, str):
+            feedback = encode_feedback(feedback)
+        survivors = self._survivors(guess, feedback)
+        if len(self.alive) == len(self.word_list):
+            # Nothing filtered yet, e.g. after the opening move
+            self.alive = survivors
+        else:
+            self.alive = self.alive[np.isin(self.alive, survivors, assume_unique=True)]
+        return self.alive
     
-    def _calculate_word_score(self, word):
-        """Calculate a score for a word based on letter frequency and coverage."""
-        score = 0
-        unique_letters = set(word)
-        
-        # Score based on letter frequency
-        for letter in unique_letters:
-            if letter in self.letter_frequency:
-                # Sum frequency across all positions
-                score += sum(self.letter_frequency[letter])
-        
-        # Bonus for words with more unique letters
-        score += len(unique_letters) * 10
+    def _survivors(self, guess, code):
+        """Get the word ids of the full list that would give the guess this feedback code."""
+        key = (guess, code)
+        survivors = self.survivor_cache.get(key)
+        if survivors is None:
+            # A word stays possible if it would have produced the same feedback
+            if guess in self.word_index:
+                survivors = np.flatnonzero(self.pattern_matrix[self.word_index[guess]] == code)
+            else:
+                all_ids = np.arange(len(self.word_list))
+                survivors = np.flatnonzero(filter_mask(self.words_u8, all_ids, encode_words([guess])[0], code))
+            # Shared with the cache and possibly used as an AI's alive array
+            survivors.flags.writeable = False
+            if len(self.survivor_cache) < self.survivor_cache_size:
+                self.survivor_cache[key] = survivors
+        return survivors
+    
+    @staticmethod
+    def _calculate_word_scores(words_u8, letter_totals):
+        """Calculate a score for every word based on letter frequency and coverage."""
+        # One-hot (N, 26) letter sets, so repeated letters only count once
+        letter_sets = np.zeros((len(words_u8), 26), dtype=np.int64)
+        letter_sets[np.arange(len(words_u8))[:, None], words_u8] = 1
         
-        return score
+        # Score based on letter frequency summed across all positions, plus a
+        # bonus for words with more unique letters
+        return letter_sets @ letter_totals + letter_sets.sum(axis=1) * 10
     
-    def get_best_guess(self, game_state=None):
-        """Get the best guess based on current possible words."""
-        if not self.possible_words:
+    def _calculate_entropies(self, candidate_idx):
+        """Calculate the information entropy of each candidate word's feedback over the possible words."""
+        return pattern_entropies(self.pattern_matrix[np.ix_(candidate_idx, self.alive)], self.xlog2x)
+    
+    def get_best_guess(self, game_state=None, verbose=True):
+        """Get the best guess based on current possible words, with reasoning only when verbose."""
+        # Work on word ids; words are only looked up for the ones reported
+        remaining = len(self.alive)
+        if not remaining:
             return None, "No possible words remaining"
         
         # If we have very few possible words, pick the first one
-        if len(self.possible_words) <= 2:
-            return self.possible_words[0], f"Only {len(self.possible_words)} possible words remaining"
-        
-        # Calculate scores for all possible words
-        word_scores = []
-        for word in self.possible_words:
-            score = self._calculate_word_score(word)
-            word_scores.append((word, score))
-        
-        # Sort by score (highest first)
-        word_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        best_word = word_scores[0][0]
-        best_score = word_scores[0][1]
+        if remaining <= 2:
+            return self.word_list[self.alive[0]], f"Only {remaining} possible words remaining" if verbose else ""
         
-        # Generate reasoning
-        reasoning = self._generate_reasoning(best_word, word_scores[:5])
+        # The decision depends only on the possible words, so reuse it when the
+        # same set comes up again; the opening move always has the full list
+        if remaining == len(self.word_list):
+            key = b''
+        else:
+            key = hashlib.blake2b(self.alive.tobytes(), digest_size=8).digest()
+        decision = self.decision_cache.get(key)
+        if decision is None:
+            decision = self._rank_guesses(remaining)
+            if len(self.decision_cache) < self.decision_cache_size:
+                self.decision_cache[key] = decision
         
+        best_word, word_scores, reasoning = decision
+        if not verbose:
+            return best_word, ""
+        # Reasoning is built the first time someone asks for it, then kept with the decision
+        if reasoning is None:
+            reasoning = decision[2] = self._generate_reasoning(best_word, word_scores)
         return best_word, reasoning
     
+    def _rank_guesses(self, remaining):
+        """Rank the possible words and return [best word, top (word, entropy) pairs, reasoning placeholder]."""
+        # Score possible words by the entropy of their feedback over the possible
+        # words, breaking ties by letter frequency score
+        entropies = self._calculate_entropies(self.alive)
+        # Only the top five are reported, so sort just the words that can reach them
+        shown = min(5, remaining)
+        threshold = np.partition(entropies, -shown)[-shown]
+        top = np.flatnonzero(entropies >= threshold)
+        top = top[np.lexsort((-self.word_scores[self.alive[top]], -entropies[top]))][:shown]
+        word_scores = [(self.word_list[self.alive[i]], entropies[i]) for i in top]
+        
+        return [word_scores[0][0], word_scores, None]
+    
     def _generate_reasoning(self, word, top_words):
         """Generate reasoning for why this word was chosen."""
         unique_letters = set(word)
@@ -204,12 +287,15 @@ class WordleAI:
         # Letter coverage reasoning
         reasoning_parts.append(f"Chose '{word.upper()}' with {len(unique_letters)} unique letters")
         
+        # Information reasoning
+        reasoning_parts.append(f"Expected information: {top_words[0][1]:.3f} bits")
+        
         # Frequency reasoning
-        total_freq = sum(sum(self.letter_frequency.get(letter, [0])) for letter in unique_letters)
+        total_freq = sum(self.letter_totals[ord(letter) - 97] for letter in unique_letters)
         reasoning_parts.append(f"Total letter frequency score: {total_freq}")
         
         # Remaining words reasoning
-        reasoning_parts.append(f"Eliminates from {len(self.possible_words)} possible words")
+        reasoning_parts.append(f"Eliminates from {len(self.alive)} possible words")
         
         # Alternative words
         if len(top_words) > 1:
@@ -220,9 +306,9 @@ class WordleAI:
     
     def update_with_feedback(self, guess, feedback):
         """Update AI state with new guess and feedback."""
-        remaining_count = len(self.possible_words)
-        self._filter_words(guess, feedback)
-        new_count = len(self.possible_words)
+        remaining_count = len(self.alive)
+        self._filter_ids(guess, feedback)
+        new_count = len(self.alive)
         
         return f"Filtered from {remaining_count} to {new_count} possible words"
 
@@ -1,14 +1,49 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
-from collections import Counter
 import os
 import threading
+import traceback
 import time
 
 # Import the core logic from the existing solver
 from wordle_ai_solver import load_word_list, WordleGame, WordleAI
 from advanced_wordle_ai import OptimizedWordleAI
+from wordle_kernels import FEEDBACK_CODES, decode_feedback, pattern_matrix
+
+def _feedback(guess, solution):
+    """Compute Wordle feedback for a guess that is not in the word list."""
+    feedback = ['B'] * 5
+    # Unused solution letter counts, indexed by letter code (a=0 ... z=25)
+    counts = bytearray(26)
+    for letter in solution:
+        counts[ord(letter) - 97] += 1
+    
+    # First pass: greens
+    for i in range(5):
+        if guess[i] == solution[i]:
+            feedback[i] = 'G'
+            counts[ord(guess[i]) - 97] -= 1
+    
+    # Second pass: yellows
+    for i in range(5):
+        if feedback[i] == 'B':
+            letter = ord(guess[i]) - 97
+            if counts[letter] > 0:
+                feedback[i] = 'Y'
+                counts[letter] -= 1
+    
+    return ''.join(feedback)
+
+class GuiWordleAI(OptimizedWordleAI):
+    """OptimizedWordleAI that keeps vowel-heavy words out of its extra guess candidates."""
+    
+    # Fewer candidates keep the GUI responsive; possible solutions are still
+    # always considered
+    max_guess_vowels = 2
+
+# Board cell (background, foreground) colors for each feedback tile
+TILE_COLORS = {'G': ('green', 'white'), 'Y': ('yellow', 'black'), 'B': ('gray', 'white')}
 
 class WordleGUI:
     def __init__(self, root):
@@ -19,14 +54,26 @@ class WordleGUI:
         
         # Load word list and initialize AI
         self.word_list = load_word_list()
-        self.ai = OptimizedWordleAI(self.word_list)
+        self.ai = GuiWordleAI(self.word_list)
+        
+        # Word ids and the shared feedback code table for dictionary words
+        self.word_index = {word: i for i, word in enumerate(self.word_list)}
+        self.pattern_matrix = pattern_matrix(tuple(self.word_list))
         
-        # Game state
+        # Game state; targets are dealt from a shuffled pass over the word list
+        self._shuffle_iter = iter([])
         self.current_word = None
         self.attempts = 0
         self.max_attempts = 6
         self.game_over = False
         
+        # Log lines held back while a batch of updates (like an AI solve) runs
+        self._log_buffer = []
+        self._log_batch = False
+        
+        # Background thread running the current AI solve, if any
+        self._solver_thread = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -84,6 +131,12 @@ class WordleGUI:
                 row_labels.append(label)
             self.board_labels.append(row_labels)
         
+        # (text, bg, fg) last pushed to each board cell; colors start unset so the
+        # first clear paints every cell
+        self._board_state = [[("", None, None)] * 5 for _ in range(6)]
+        # Rows painted since the board was last cleared
+        self._rows_used = 6
+        
         # Input frame
         input_frame = ttk.LabelFrame(main_frame, text="Make a Guess", padding="10")
         input_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 20))
@@ -151,17 +204,18 @@ class WordleGUI:
         
     def new_game(self):
         """Start a new game."""
-        self.current_word = random.choice(self.word_list)
+        self.current_word = self._next_target()
         self.attempts = 0
         self.game_over = False
         
-        # Reset AI
-        self.ai = OptimizedWordleAI(self.word_list)
+        # Reset AI; its word list tables and first word carry over between games
+        self.ai.reset()
         
         # Clear board
-        for row in self.board_labels:
-            for label in row:
-                label.config(text="", bg='white', fg='black')
+        for row in range(self._rows_used):
+            for col in range(5):
+                self._paint(row, col, "", 'white', 'black')
+        self._rows_used = 0
         
         # Clear input
         self.clear_input()
@@ -169,10 +223,23 @@ class WordleGUI:
         # Update status
         self.log_message(f"New game started! Target word: {self.current_word.upper()}")
         self.log_message(f"AI optimal first word: {self.ai.optimal_first_word.upper()}")
-        self.log_message(f"Total possible words: {len(self.ai.possible_words)}")
-        
+        self.log_message(f"Total possible words: {int(self.ai.possible_mask.sum())}")
+        
+    def _next_target(self):
+        """Deal the next target word, reshuffling once every word has been played."""
+        try:
+            return next(self._shuffle_iter)
+        except StopIteration:
+            order = self.word_list[:]
+            random.shuffle(order)
+            self._shuffle_iter = iter(order)
+            return next(self._shuffle_iter)
+    
     def make_guess(self):
         """Make a guess."""
+        # The Return binding still fires while an AI solve owns the AI and board
+        if self._solver_thread is not None:
+            return
         if self.game_over:
             messagebox.showwarning("Game Over", "Game is already over. Start a new game.")
             return
@@ -183,25 +250,17 @@ class WordleGUI:
             messagebox.showerror("Invalid Input", "Please enter a 5-letter word.")
             return
         
-        if guess not in self.word_list:
+        if guess not in self.word_index:
             messagebox.showerror("Invalid Word", "Word not in dictionary.")
             return
         
-        # Display guess on board
-        for i, letter in enumerate(guess):
-            self.board_labels[self.attempts][i].config(text=letter.upper())
-        
         # Get feedback
         feedback = self.get_feedback(guess, self.current_word)
         
-        # Update board colors
+        # Display guess on board with its colors
         for i, (letter, color) in enumerate(zip(guess, feedback)):
-            if color == 'G':
-                self.board_labels[self.attempts][i].config(bg='green', fg='white')
-            elif color == 'Y':
-                self.board_labels[self.attempts][i].config(bg='yellow', fg='black')
-            else:
-                self.board_labels[self.attempts][i].config(bg='gray', fg='white')
+            self._paint(self.attempts, i, letter.upper(), *TILE_COLORS[color])
+        self._rows_used = max(self._rows_used, self.attempts + 1)
         
         # Update AI
         ai_update = self.ai.update_with_feedback(guess, feedback)
@@ -227,37 +286,33 @@ class WordleGUI:
         
     def get_feedback(self, guess, solution):
         """Get Wordle feedback for a guess."""
-        feedback = ['B'] * 5
-        solution_counter = Counter(solution)
-        
-        # First pass: greens
-        for i in range(5):
-            if guess[i] == solution[i]:
-                feedback[i] = 'G'
-                solution_counter[guess[i]] -= 1
-        
-        # Second pass: yellows
-        for i in range(5):
-            if feedback[i] == 'B' and guess[i] in solution and solution_counter[guess[i]] > 0:
-                feedback[i] = 'Y'
-                solution_counter[guess[i]] -= 1
+        # Every won game ends on this
+        if guess == solution:
+            return 'GGGGG'
+        
+        # Dictionary words are a single table lookup
+        if guess in self.word_index and solution in self.word_index:
+            return decode_feedback(self.pattern_matrix[self.word_index[guess], self.word_index[solution]])
         
-        return ''.join(feedback)
+        return _feedback(guess, solution)
     
     def submit_feedback(self):
         """Submit manual feedback."""
-        feedback = self.feedback_var.get().strip().upper()
-        
-        if len(feedback) != 5:
-            messagebox.showerror("Invalid Input", "Please enter 5 characters (G/Y/B).")
+        if self._solver_thread is not None:
             return
+        feedback = self.feedback_var.get().strip().upper()
         
-        if not all(c in 'GYB' for c in feedback):
-            messagebox.showerror("Invalid Input", "Feedback must contain only G, Y, or B.")
+        # Every valid feedback string has a code, so one lookup validates it
+        code = FEEDBACK_CODES.get(feedback)
+        if code is None:
+            if len(feedback) != 5:
+                messagebox.showerror("Invalid Input", "Please enter 5 characters (G/Y/B).")
+            else:
+                messagebox.showerror("Invalid Input", "Feedback must contain only G, Y, or B.")
             return
         
         # Update AI with feedback
-        ai_update = self.ai.update_with_feedback(self.last_guess, feedback)
+        ai_update = self.ai.update_with_feedback(self.last_guess, code)
         self.log_message(f"Manual feedback: {feedback} | AI update: {ai_update}")
         
         # Clear feedback input
@@ -265,6 +320,8 @@ class WordleGUI:
         
     def auto_feedback(self):
         """Automatically calculate and submit feedback for the last guess."""
+        if self._solver_thread is not None:
+            return
         if not hasattr(self, 'last_guess') or not self.current_word:
             messagebox.showwarning("No Guess", "Make a guess first.")
             return
@@ -278,51 +335,84 @@ class WordleGUI:
         if not self.current_word:
             messagebox.showwarning("No Game", "Start a new game first.")
             return
+        if self._solver_thread is not None:
+            return
         
-        # Reset AI
-        self.ai = OptimizedWordleAI(self.word_list)
-        
+        # Reset AI; its word list tables and first word carry over between games
+        self.ai.reset()
         self.log_message("🤖 AI solving...")
         
-        attempts = 0
-        while attempts < 6:
-            guess, reasoning = self.ai.get_best_guess()
-            
-            if not guess:
-                self.log_message("❌ AI failed to find a valid guess")
-                break
-            
-            # Display guess on board
-            for i, letter in enumerate(guess):
-                self.board_labels[attempts][i].config(text=letter.upper())
-            
-            # Get feedback
-            feedback = self.get_feedback(guess, self.current_word)
-            
-            # Update board colors
-            for i, (letter, color) in enumerate(zip(guess, feedback)):
-                if color == 'G':
-                    self.board_labels[attempts][i].config(bg='green', fg='white')
-                elif color == 'Y':
-                    self.board_labels[attempts][i].config(bg='yellow', fg='black')
-                else:
-                    self.board_labels[attempts][i].config(bg='gray', fg='white')
-            
-            # Update AI
-            ai_update = self.ai.update_with_feedback(guess, feedback)
+        # Solve off the Tk thread so the window keeps redrawing; every control
+        # that touches the AI or the board is disabled until the solve finishes
+        self._set_game_controls_state('disabled')
+        self._solver_thread = threading.Thread(target=self._ai_solve_worker,
+                                               args=(self.current_word,), daemon=True)
+        self._solver_thread.start()
+    
+    def _ai_solve_worker(self, solution):
+        """Play the AI against solution, handing each step to the Tk thread."""
+        try:
+            solution_id = self.word_index[solution]
+            attempts = 0
+            while attempts < 6:
+                guess, reasoning = self.ai.get_best_guess()
+                
+                if not guess:
+                    self.root.after(0, self.log_message, "❌ AI failed to find a valid guess")
+                    break
+                
+                # Get feedback; the AI only guesses dictionary words, so read the code
+                # straight from the feedback table
+                code = self.pattern_matrix[self.word_index[guess], solution_id]
+                ai_update = self.ai.update_with_feedback(guess, code)
+                
+                step = (attempts, guess, decode_feedback(code), reasoning, ai_update)
+                self.root.after(0, self._apply_ai_step, step)
+                
+                if guess == solution:
+                    break
+                
+                attempts += 1
             
-            # Log results
+            if attempts >= 6:
+                self.root.after(0, self.log_message, f"❌ AI failed to solve {solution.upper()}")
+        except Exception as e:
+            # Errors on this thread would otherwise vanish with it
+            traceback.print_exc()
+            self.root.after(0, self.log_message, f"❌ AI solve failed: {e}")
+        finally:
+            self.root.after(0, self._finish_ai_solve)
+    
+    def _apply_ai_step(self, step):
+        """Show one AI guess on the board and in the log."""
+        attempts, guess, feedback, reasoning, ai_update = step
+        
+        # Display guess on board with its colors
+        for i, (letter, color) in enumerate(zip(guess, feedback)):
+            self._paint(attempts, i, letter.upper(), *TILE_COLORS[color])
+        self._rows_used = max(self._rows_used, attempts + 1)
+        
+        # Log results in one write
+        self._log_batch = True
+        try:
             self.log_message(f"AI Guess {attempts + 1}: {guess.upper()} | {reasoning}")
             self.log_message(f"Feedback: {feedback} | {ai_update}")
-            
-            if guess == self.current_word:
+            if feedback == 'GGGGG':
                 self.log_message(f"🎉 AI solved it in {attempts + 1} attempts!")
-                break
-            
-            attempts += 1
-        
-        if attempts >= 6:
-            self.log_message(f"❌ AI failed to solve {self.current_word.upper()}")
+        finally:
+            self._log_batch = False
+            self._flush_log()
+    
+    def _finish_ai_solve(self):
+        """Re-enable the controls disabled while the AI was solving."""
+        self._solver_thread = None
+        self._set_game_controls_state('normal')
+    
+    def _set_game_controls_state(self, state):
+        """Enable or disable every control that changes the AI or the board."""
+        for widget in (self.new_game_btn, self.ai_solve_btn, self.word_entry, self.submit_btn,
+                       self.feedback_entry, self.submit_feedback_btn, self.auto_feedback_btn):
+            widget.config(state=state)
     
     def show_solution(self):
         """Show the current solution."""
@@ -337,7 +427,7 @@ class WordleGUI:
 🤖 AI Information:
 • Optimal first word: {self.ai.optimal_first_word.upper()}
 • Total words in dictionary: {len(self.word_list)}
-• Current possible words: {len(self.ai.possible_words)}
+• Current possible words: {int(self.ai.possible_mask.sum())}
 • AI type: OptimizedWordleAI with advanced heuristics
 
 📊 AI Features:
@@ -357,6 +447,19 @@ class WordleGUI:
         
         self.log_message(info)
     
+    def _paint(self, row, col, text, bg, fg):
+        """Set a board cell, only sending Tk the attributes that changed."""
+        old_text, old_bg, old_fg = self._board_state[row][col]
+        if (text, bg, fg) == (old_text, old_bg, old_fg):
+            return
+        
+        label = self.board_labels[row][col]
+        if text != old_text:
+            label.config(text=text)
+        if bg != old_bg or fg != old_fg:
+            label.config(bg=bg, fg=fg)
+        self._board_state[row][col] = (text, bg, fg)
+    
     def clear_input(self):
         """Clear input fields."""
         self.word_var.set("")
@@ -365,9 +468,16 @@ class WordleGUI:
     
     def log_message(self, message):
         """Add message to status log."""
-        self.status_text.insert(tk.END, message + "\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
+        self._log_buffer.append(message)
+        if not self._log_batch:
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Write buffered messages to the status log with a single insert."""
+        if self._log_buffer:
+            self.status_text.insert(tk.END, "\n".join(self._log_buffer) + "\n")
+            self._log_buffer.clear()
+            self.status_text.see(tk.END)
 
 def main():
     root = tk.Tk()
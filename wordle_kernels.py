@@ -0,0 +1,139 @@
+import hashlib
+import os
+from functools import lru_cache
+import numpy as np
+
+# Feedback patterns are encoded as a single int in [0, 243): tile i contributes
+# 3**i * (0 for 'B', 1 for 'Y', 2 for 'G').
+NUM_PATTERNS = 243
+ALL_GREEN = 242
+TILE_CODES = {'B': 0, 'Y': 1, 'G': 2}
+POWERS_OF_THREE = (1, 3, 9, 27, 81)
+
+# Every feedback string indexed by its code, and the reverse mapping
+FEEDBACK_STRS = tuple(''.join('BYG'[code // power % 3] for power in POWERS_OF_THREE)
+                      for code in range(NUM_PATTERNS))
+FEEDBACK_CODES = {feedback: code for code, feedback in enumerate(FEEDBACK_STRS)}
+
+# Feedback code matrices are saved here so later runs can load instead of rebuild them
+PATTERN_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".wordle_cache")
+
+# Words packed into a uint64 use the low five byte lanes, one letter per lane.
+LANE_ONES = np.uint64(0x0101010101)
+LANE_LOW_BITS = np.uint64(0x7F7F7F7F7F)
+LANE_HIGH_BITS = np.uint64(0x8080808080)
+
+def encode_words(words):
+    """Encode five-letter words as an (N, 5) uint8 array of letter codes (a=0 ... z=25)."""
+    buffer = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return buffer.reshape(-1, 5) - ord('a')
+
+def encode_feedback(feedback):
+    """Encode a 'GYB' feedback string as its base-3 pattern code."""
+    return FEEDBACK_CODES[feedback]
+
+def decode_feedback(code):
+    """Decode a base-3 pattern code back into a 'GYB' feedback string."""
+    return FEEDBACK_STRS[code]
+
+def pack_words(words_u8):
+    """Pack encoded words into uint64s holding letter i in byte lane i."""
+    packed = np.zeros(len(words_u8), dtype=np.uint64)
+    for i in range(5):
+        packed |= words_u8[:, i].astype(np.uint64) << np.uint64(8 * i)
+    return packed
+
+def _zero_lanes(x):
+    """Set the high bit of every zero byte among the five letter lanes of x, branchlessly."""
+    return ~(((x & LANE_LOW_BITS) + LANE_LOW_BITS) | x) & LANE_HIGH_BITS
+
+def _count_lanes(lanes):
+    """Count the lane high bits set in a _zero_lanes style mask."""
+    return ((lanes >> np.uint64(7)) * LANE_ONES) >> np.uint64(32)
+
+def feedback_block(guesses_u8, solutions_u8):
+    """Compute the (G, S) feedback codes of encoded guesses against encoded solutions."""
+    guesses = pack_words(guesses_u8)[:, None]
+    solutions = pack_words(solutions_u8)[None, :]
+    # One XOR compares all five tiles of a pair; equal letters leave zero lanes
+    green = _zero_lanes(guesses ^ solutions)
+    unmatched = [((green >> np.uint64(8 * i + 7)) & np.uint64(1)) == 0 for i in range(5)]
+    codes = np.zeros(green.shape, dtype=np.uint8)
+
+    for i in range(5):
+        letter = guesses_u8[:, i:i + 1]
+        # Solution letters not used by greens can each turn one guess tile yellow,
+        # and earlier non-green tiles of the same letter claim them first.
+        letter_lanes = _zero_lanes(solutions ^ (letter.astype(np.uint64) * LANE_ONES))
+        available = _count_lanes(letter_lanes & ~green).astype(np.int8)
+        for j in range(i):
+            available -= (guesses_u8[:, j:j + 1] == letter) & unmatched[j]
+        yellow = unmatched[i] & (available > 0)
+        codes += (2 * ~unmatched[i] + yellow).astype(np.uint8) * np.uint8(POWERS_OF_THREE[i])
+
+    return codes
+
+def feedback_row(guess_u8, words_u8):
+    """Compute the feedback codes of one encoded guess against every encoded solution."""
+    return feedback_block(guess_u8[None, :], words_u8)[0]
+
+def filter_mask(words_u8, alive_idx, guess_u8, code):
+    """Flag which of the alive encoded words would give a guess the feedback code."""
+    return feedback_row(guess_u8, words_u8[alive_idx]) == code
+
+def build_pattern_matrix(words_u8, block_size=64):
+    """Build the full guess x solution feedback code matrix for an encoded word list."""
+    matrix = np.empty((len(words_u8), len(words_u8)), dtype=np.uint8)
+    for start in range(0, len(words_u8), block_size):
+        matrix[start:start + block_size] = feedback_block(words_u8[start:start + block_size], words_u8)
+    return matrix
+
+def xlog2x_table(max_count):
+    """Tabulate c * log2(c) for every bucket count c in [0, max_count]."""
+    counts = np.arange(max_count + 1, dtype=np.float64)
+    table = np.zeros(max_count + 1)
+    table[1:] = counts[1:] * np.log2(counts[1:])
+    return table
+
+def pattern_entropies(codes, xlog2x=None):
+    """Compute the entropy of the feedback code distribution in each row of a (C, P) code matrix.
+
+    xlog2x is an optional xlog2x_table covering at least P; passing a prebuilt one
+    turns the per-bucket logarithms into table lookups.
+    """
+    rows, total = codes.shape
+    if total == 0:
+        return np.zeros(rows)
+    if xlog2x is None:
+        xlog2x = xlog2x_table(total)
+    # Offset each row into its own block of bins so one bincount tallies every row
+    offsets = np.arange(rows)[:, None] * NUM_PATTERNS
+    counts = np.bincount((codes + offsets).ravel(), minlength=rows * NUM_PATTERNS)
+    # H = -sum(c/N * log2(c/N)) = log2(N) - sum(c * log2(c)) / N
+    return np.log2(total) - xlog2x[counts.reshape(rows, NUM_PATTERNS)].sum(axis=1) / total
+
+@lru_cache(maxsize=8)
+def pattern_matrix(words):
+    """Get the shared, read-only feedback code matrix for a tuple of words."""
+    digest = hashlib.sha1("\n".join(words).encode("ascii")).hexdigest()
+    path = os.path.join(PATTERN_CACHE_DIR, f"patterns-{digest}.npy")
+    try:
+        matrix = np.load(path, mmap_mode='r')
+        # A truncated or foreign file is rebuilt rather than trusted
+        if matrix.shape == (len(words), len(words)) and matrix.dtype == np.uint8:
+            return matrix
+    except (OSError, ValueError):
+        pass
+
+    matrix = build_pattern_matrix(encode_words(words))
+    matrix.flags.writeable = False
+    # Write to a temporary file first so concurrent runs never see a partial matrix
+    try:
+        os.makedirs(PATTERN_CACHE_DIR, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            np.save(f, matrix)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+    return matrix
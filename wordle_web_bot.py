@@ -1,5 +1,11 @@
+import copy
+import queue
+import re
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -7,13 +13,73 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import JavascriptException, TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
 # Import our AI logic
 from wordle_ai_solver import load_word_list
 from advanced_wordle_ai import OptimizedWordleAI
 
+# Letter and optional state in a tile's aria-label, e.g. "1st letter, A, correct"
+ARIA_RE = re.compile(r",\s*([a-z])\b(?:,\s*(correct|present|absent))?", re.IGNORECASE)
+# Feedback for each tile state
+TILE_FEEDBACK = {'correct': 'G', 'present': 'Y', 'absent': 'B'}
+
+# Reads every board tile in one script call, as a list of rows of
+# [aria-label, data-state, text] tiles
+JS_READ_BOARD = """
+const rows = document.querySelectorAll("[role='group'][aria-label*='Row']");
+return Array.from(rows, row => Array.from(row.querySelectorAll("[data-testid='tile']"),
+    tile => [tile.getAttribute('aria-label'), tile.getAttribute('data-state'), tile.innerText]));
+"""
+
+# Toasts and modals: the only places game over messages appear
+POPUP_SELECTOR = "[data-testid='toast-container'], [role='dialog'], [aria-live]"
+
+# Reports whether any of the texts passed as its second argument shows in a
+# visible popup matching its first argument, in one script call
+JS_POPUP_HAS_TEXT = """
+const [selector, texts] = arguments;
+const popups = Array.from(document.querySelectorAll(selector))
+    .filter(popup => popup.getClientRects().length > 0 && popup.textContent.trim());
+return popups.some(popup => texts.some(text => popup.textContent.includes(text)));
+"""
+
+@lru_cache(maxsize=1)
+def _driver_path():
+    """Resolve the ChromeDriver binary once per process."""
+    return ChromeDriverManager().install()
+
+class DriverPool:
+    """A fixed set of browser drivers that concurrently played games take turns using."""
+    
+    def __init__(self, size, create_driver):
+        """Launch size drivers up front with create_driver."""
+        self._drivers = []
+        self._idle = queue.Queue()
+        try:
+            for _ in range(size):
+                driver = create_driver()
+                self._drivers.append(driver)
+                self._idle.put(driver)
+        except Exception:
+            self.close()
+            raise
+    
+    def acquire(self):
+        """Take an idle driver, waiting for one if all are in use."""
+        return self._idle.get()
+    
+    def release(self, driver):
+        """Return a driver taken with acquire."""
+        self._idle.put(driver)
+    
+    def close(self):
+        """Quit every driver in the pool."""
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers = []
+
 class WordleWebBot:
     def __init__(self, headless=False):
         """Initialize the Wordle web bot."""
@@ -22,9 +88,18 @@ class WordleWebBot:
         self.driver = None
         self.headless = headless
         self.wait = None
+        # Page body that guesses are typed into
+        self._body = None
+        # Number of the current game's attempts already fed to the AI
+        self._processed = 0
         
     def setup_driver(self):
         """Setup Chrome driver with automatic driver management."""
+        self._attach(self._create_driver())
+        print("Chrome driver setup complete!")
+    
+    def _create_driver(self):
+        """Launch a new Chrome driver with the bot's options."""
         chrome_options = Options()
         if self.headless:
             chrome_options.add_argument("--headless")
@@ -33,20 +108,38 @@ class WordleWebBot:
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
         
+        # The bot only reads the DOM, so skip images, extensions and background traffic
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-features=Translate,OptimizationHints")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
         # Add user agent to avoid detection
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
         
         # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
-        
-        print("Chrome driver setup complete!")
+        service = Service(_driver_path())
+        return webdriver.Chrome(service=service, options=chrome_options)
+    
+    def _attach(self, driver):
+        """Make the bot play through the given driver."""
+        self.driver = driver
+        self.wait = WebDriverWait(driver, 10)
+        self._body = None
         
     def open_wordle(self):
         """Open the Wordle website."""
         self.driver.get("https://www.nytimes.com/games/wordle/index.html")
-        time.sleep(2)
+        
+        # Wait for the board to render instead of sleeping a fixed time
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='tile']")))
+        except TimeoutException:
+            print("Timed out waiting for the game board")
         
         # Close any popups or modals
         try:
@@ -59,26 +152,19 @@ class WordleWebBot:
         except:
             pass
         
+        self._body = self.driver.find_element(By.TAG_NAME, "body")
         print("Wordle website opened successfully!")
         
     def get_game_state(self):
         """Read the current game state from the website."""
         try:
-            # Wait a moment for any animations to complete
-            time.sleep(1)
-            
-            # Find all tile rows
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "[role='group'][aria-label*='Row']")
-            
             attempts = []
-            for row in rows:
-                tiles = row.find_elements(By.CSS_SELECTOR, "[data-testid='tile']")
+            for tiles in self._read_board():
                 if not tiles or len(tiles) != 5:
                     continue
                     
                 # Check if this row has been filled
-                first_tile = tiles[0]
-                first_state = first_tile.get_attribute("data-state")
+                first_state = tiles[0][1]
                 
                 # Skip empty rows
                 if first_state == "empty" or first_state == "tbd":
@@ -88,39 +174,23 @@ class WordleWebBot:
                 word = ""
                 feedback = ""
                 
-                for tile in tiles:
+                for aria_label, state, _ in tiles:
                     # Get the letter from aria-label
-                    aria_label = tile.get_attribute("aria-label")
                     if not aria_label:
                         continue
                     
                     # Parse letter from aria-label (format: "1st letter, A" or "1st letter, A, correct")
-                    parts = aria_label.split(", ")
-                    if len(parts) >= 2:
-                        letter = parts[1].strip()
-                    else:
+                    match = ARIA_RE.search(aria_label)
+                    if not match:
                         continue
                     
-                    # Get the state
-                    state = tile.get_attribute("data-state")
+                    word += match.group(1)
                     
-                    word += letter
-                    
-                    # Map states to our feedback format
-                    if state == "correct":
-                        feedback += "G"
-                    elif state == "present":
-                        feedback += "Y"
-                    elif state == "absent":
-                        feedback += "B"
-                    else:
-                        # For unknown states, try to infer from aria-label
-                        if "correct" in aria_label.lower():
-                            feedback += "G"
-                        elif "present" in aria_label.lower():
-                            feedback += "Y"
-                        else:
-                            feedback += "B"
+                    # Map states to our feedback format; for unknown states, try
+                    # to infer from aria-label
+                    if state not in TILE_FEEDBACK:
+                        state = (match.group(2) or "").lower()
+                    feedback += TILE_FEEDBACK.get(state, "B")
                 
                 # Only add if we have a complete 5-letter word
                 if len(word) == 5 and len(feedback) == 5:
@@ -135,27 +205,18 @@ class WordleWebBot:
             traceback.print_exc()
             return []
     
-    def is_game_over(self):
-        """Check if the game is over."""
+    def is_game_over(self, attempts=None):
+        """Check if the game is over, counting the given attempts instead of rereading the board if passed."""
         try:
             # Look for game over indicators
-            game_over_indicators = [
-                "//div[contains(text(), 'Not in word list')]",
-                "//div[contains(text(), 'Game Over')]",
-                "//div[contains(text(), 'Congratulations')]",
-                "//div[contains(text(), 'You win')]"
-            ]
+            game_over_indicators = ['Not in word list', 'Game Over', 'Congratulations', 'You win']
             
-            for xpath in game_over_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, xpath)
-                    if element.is_displayed():
-                        return True
-                except:
-                    continue
+            if self._any_visible(game_over_indicators):
+                return True
             
             # Check if we've made 6 attempts
-            attempts = self.get_game_state()
+            if attempts is None:
+                attempts = self.get_game_state()
             return len(attempts) >= 6
             
         except Exception as e:
@@ -166,37 +227,29 @@ class WordleWebBot:
         """Check if the game was won."""
         try:
             # Look for win indicators
-            win_indicators = [
-                "//div[contains(text(), 'Congratulations')]",
-                "//div[contains(text(), 'You win')]",
-                "//div[contains(text(), 'Well done')]"
-            ]
+            win_indicators = ['Congratulations', 'You win', 'Well done']
             
-            for xpath in win_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, xpath)
-                    if element.is_displayed():
-                        return True
-                except:
-                    continue
-            
-            return False
+            return self._any_visible(win_indicators)
             
         except Exception as e:
             print(f"Error checking game won: {e}")
             return False
     
-    def make_guess(self, word):
-        """Make a guess by typing the word and pressing Enter."""
+    def _any_visible(self, texts):
+        """Check whether a visible popup shows any of the texts, in one round trip."""
+        return self.driver.execute_script(JS_POPUP_HAS_TEXT, POPUP_SELECTOR, texts)
+    
+    def make_guess(self, word, row_index=None):
+        """Make a guess by typing the word and pressing Enter, waiting for row_index to resolve if given."""
         try:
-            # Type the word
-            actions = webdriver.ActionChains(self.driver)
-            actions.send_keys(word.upper())
-            actions.send_keys(Keys.RETURN)
-            actions.perform()
+            # Type the word and submit it in a single command
+            if self._body is None:
+                self._body = self.driver.find_element(By.TAG_NAME, "body")
+            self._body.send_keys(word.upper() + Keys.RETURN)
             
             # Wait for the animation to complete
-            time.sleep(3)
+            if row_index is not None:
+                self._wait_for_row_resolved(row_index)
             
             print(f"Made guess: {word.upper()}")
             return True
@@ -205,26 +258,59 @@ class WordleWebBot:
             print(f"Error making guess: {e}")
             return False
     
+    def _wait_for_row_resolved(self, row_index):
+        """Wait until every tile in a row has flipped to its final state."""
+        def row_resolved(driver):
+            # One board read per poll, so there are no element references to go stale
+            rows = self._read_board()
+            return (row_index < len(rows) and len(rows[row_index]) == 5
+                    and all(state in TILE_FEEDBACK for _, state, _ in rows[row_index]))
+        
+        try:
+            WebDriverWait(self.driver, 10, ignored_exceptions=(JavascriptException,)).until(row_resolved)
+            return True
+        except TimeoutException:
+            # Rejected words never flip, e.g. ones not in the word list
+            print(f"Timed out waiting for row {row_index + 1} to resolve")
+            return False
+    
+    def _read_board(self):
+        """Run JS_READ_BOARD, straight through the DevTools protocol on Chromium drivers."""
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            try:
+                response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": f"(() => {{{JS_READ_BOARD}}})()",
+                    "returnByValue": True,
+                })
+                return response["result"]["value"]
+            except Exception:
+                pass
+        return self.driver.execute_script(JS_READ_BOARD)
+    
+    def _poll_state(self):
+        """Read the board once, returning the attempts so far and whether the game is over."""
+        attempts = self.get_game_state()
+        game_over = bool(attempts) and attempts[-1][1] == 'GGGGG' or len(attempts) >= 6
+        return attempts, game_over
+    
     def reset_ai(self):
         """Reset the AI for a new game."""
         self.ai = OptimizedWordleAI(self.word_list)
+        self._processed = 0
     
     def debug_tile_structure(self):
         """Debug method to inspect the actual tile structure."""
         try:
             print("\n=== DEBUG: Inspecting tile structure ===")
             
-            # Find all tile rows
-            rows = self.driver.find_elements(By.CSS_SELECTOR, "[role='group'][aria-label*='Row']")
+            # Read all tile rows
+            rows = self._read_board()
             print(f"Found {len(rows)} rows")
             
-            for i, row in enumerate(rows):
-                tiles = row.find_elements(By.CSS_SELECTOR, "[data-testid='tile']")
-                
+            for i, tiles in enumerate(rows):
                 # Check if this row is completely empty
                 all_empty = True
-                for tile in tiles:
-                    data_state = tile.get_attribute("data-state")
+                for _, data_state, _ in tiles:
                     if data_state != "empty" and data_state != "tbd":
                         all_empty = False
                         break
@@ -236,11 +322,7 @@ class WordleWebBot:
                 print(f"\nRow {i+1}:")
                 print(f"  Found {len(tiles)} tiles")
                 
-                for j, tile in enumerate(tiles):
-                    aria_label = tile.get_attribute("aria-label")
-                    data_state = tile.get_attribute("data-state")
-                    text_content = tile.text
-                    
+                for j, (aria_label, data_state, text_content) in enumerate(tiles):
                     print(f"    Tile {j+1}: aria-label='{aria_label}', data-state='{data_state}', text='{text_content}'")
             
             print("=== END DEBUG ===\n")
@@ -255,54 +337,13 @@ class WordleWebBot:
             self.open_wordle()
             
             print("Starting AI Wordle game...")
-            
-            attempts_made = 0
-            max_attempts = 6
-            
-            while attempts_made < max_attempts:
-                # Get current game state
-                attempts = self.get_game_state()
-                print(f"Current attempts: {attempts}")
-                
-                # Check if we already won (GGGGG feedback)
-                if attempts and attempts[-1][1] == 'GGGGG':
-                    print(f"🎉 AI won in {len(attempts)} attempts!")
-                    break
-                
-                # Check if we've reached max attempts
-                if len(attempts) >= max_attempts:
-                    print(f"😔 AI failed to solve the word in {max_attempts} attempts")
-                    break
-                
-                # Update AI with all previous attempts
-                for word, feedback in attempts:
-                    self.ai.update_with_feedback(word, feedback)
-                
-                # Get AI's best guess
-                guess, reasoning = self.ai.get_best_guess()
-                if not guess:
-                    print("AI cannot find a valid guess!")
-                    break
-                
-                print(f"AI reasoning: {reasoning}")
-                print(f"AI suggests: {guess.upper()}")
-                
-                # Make the guess
-                if not self.make_guess(guess):
-                    print("Failed to make guess!")
-                    break
-                
-                attempts_made += 1
-                
-                # Wait a bit before next iteration
-                time.sleep(2)
+            final_attempts = self._run_single_game()
             
             # Check final result
-            final_attempts = self.get_game_state()
             if final_attempts and final_attempts[-1][1] == 'GGGGG':
                 print(f"🎉 AI won in {len(final_attempts)} attempts!")
-            elif len(final_attempts) >= max_attempts:
-                print(f"😔 AI failed to solve the word in {max_attempts} attempts")
+            elif len(final_attempts) >= 6:
+                print("😔 AI failed to solve the word in 6 attempts")
             else:
                 print("😔 AI failed to solve the word")
             
@@ -317,58 +358,68 @@ class WordleWebBot:
             if self.driver:
                 self.driver.quit()
     
-    def play_multiple_games(self, num_games=5):
-        """Play multiple games and track statistics."""
-        stats = {'games_played': 0, 'games_won': 0, 'attempts': []}
+    def _run_single_game(self):
+        """Play one game on the open Wordle page, returning the final attempts."""
+        max_attempts = 6
+        attempts_made = 0
         
-        for game_num in range(num_games):
-            print(f"\n{'='*50}")
-            print(f"Starting Game {game_num + 1}/{num_games}")
-            print(f"{'='*50}")
-            
-            try:
-                self.setup_driver()
-                self.open_wordle()
-                self.reset_ai()
-                
-                max_attempts = 6
-                attempts_made = 0
+        # The AI thinks ahead on this thread while tiles flip; leaving the
+        # block waits for any prefetch still running
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while attempts_made < max_attempts:
+                attempts, game_over = self._poll_state()
                 
-                while attempts_made < max_attempts:
-                    attempts = self.get_game_state()
-                    
-                    # Check if we already won (GGGGG feedback)
-                    if attempts and attempts[-1][1] == 'GGGGG':
+                if game_over:
+                    # Check if we already won (GGGGG feedback) or reached max attempts
+                    if attempts[-1][1] == 'GGGGG':
                         print(f"🎉 AI won in {len(attempts)} attempts!")
-                        break
-                    
-                    # Check if we've reached max attempts
-                    if len(attempts) >= max_attempts:
+                    else:
                         print(f"😔 AI failed to solve the word in {max_attempts} attempts")
-                        break
-                    
-                    # Update AI with all previous attempts
-                    for word, feedback in attempts:
-                        self.ai.update_with_feedback(word, feedback)
-                    
-                    # Get AI's best guess
-                    guess, reasoning = self.ai.get_best_guess()
-                    if not guess:
-                        print("AI cannot find a valid guess!")
-                        break
-                    
-                    print(f"AI suggests: {guess.upper()} | Reasoning: {reasoning}")
-                    
-                    # Make the guess
-                    if not self.make_guess(guess):
-                        print("Failed to make guess!")
-                        break
-                    
-                    attempts_made += 1
-                    time.sleep(1)
+                    break
+                
+                # Update AI with the attempts it hasn't seen yet
+                for word, feedback in attempts[self._processed:]:
+                    self.ai.update_with_feedback(word, feedback)
+                self._processed = len(attempts)
                 
-                # Record result
-                final_attempts = self.get_game_state()
+                # Get AI's best guess
+                guess, reasoning = self.ai.get_best_guess()
+                if not guess:
+                    print("AI cannot find a valid guess!")
+                    break
+                
+                print(f"AI suggests: {guess.upper()} | Reasoning: {reasoning}")
+                
+                # Make the guess, letting the AI work out its likely next moves meanwhile
+                prefetch = executor.submit(self.ai.prefetch_guesses, guess)
+                if not self.make_guess(guess, len(attempts)):
+                    print("Failed to make guess!")
+                    prefetch.cancel()
+                    break
+                prefetch.result()
+                
+                attempts_made += 1
+        
+        return self.get_game_state()
+    
+    def _play_pooled_game(self, pool, game_num, num_games, stats, stats_lock):
+        """Play one of play_multiple_games' games on a driver borrowed from the pool."""
+        print(f"\n{'='*50}")
+        print(f"Starting Game {game_num + 1}/{num_games}")
+        print(f"{'='*50}")
+        
+        # Each game gets its own copy of the bot, so concurrent games don't share
+        # a driver, board cache or AI
+        bot = copy.copy(self)
+        driver = pool.acquire()
+        try:
+            bot._attach(driver)
+            bot.open_wordle()
+            bot.reset_ai()
+            
+            # Record result
+            final_attempts = bot._run_single_game()
+            with stats_lock:
                 stats['games_played'] += 1
                 
                 if final_attempts and final_attempts[-1][1] == 'GGGGG':
@@ -377,14 +428,32 @@ class WordleWebBot:
                     print(f"🎉 Won in {len(final_attempts)} attempts!")
                 else:
                     print("😔 Failed to solve")
-                
-                time.sleep(3)
-                
-            except Exception as e:
-                print(f"Error in game {game_num + 1}: {e}")
-            finally:
-                if self.driver:
-                    self.driver.quit()
+            
+            time.sleep(3)
+            
+        except Exception as e:
+            print(f"Error in game {game_num + 1}: {e}")
+        finally:
+            # Forget the finished game so the next one on this driver starts fresh
+            try:
+                driver.execute_script("window.localStorage.clear();")
+            except Exception:
+                pass
+            pool.release(driver)
+    
+    def play_multiple_games(self, num_games=5, pool_size=1):
+        """Play multiple games, pool_size of them at a time, and track statistics."""
+        stats = {'games_played': 0, 'games_won': 0, 'attempts': []}
+        stats_lock = threading.Lock()
+        
+        # Browsers are launched once and reused by every game
+        pool = DriverPool(pool_size, self._create_driver)
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                for game_num in range(num_games):
+                    executor.submit(self._play_pooled_game, pool, game_num, num_games, stats, stats_lock)
+        finally:
+            pool.close()
         
         # Print final statistics
         print(f"\n{'='*50}")
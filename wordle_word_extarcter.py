@@ -1,5 +1,9 @@
+import importlib.util
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml's C parser is much faster than the pure Python one, when it's installed
+PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
 
 # Target URL
 URL = "https://www.wordunscrambler.net/word-list/wordle-word-list"
@@ -9,7 +13,8 @@ headers = {
     "User-Agent": "Mozilla/5.0"
 }
 response = requests.get(URL, headers=headers)
-soup = BeautifulSoup(response.text, "html.parser")
+# Only the word list's <ul> elements are built into the tree
+soup = BeautifulSoup(response.content, PARSER, parse_only=SoupStrainer("ul", class_="list-unstyled"))
 
 # Extract all <a> tags inside <li> tags that are part of the word list
 word_elements = soup.select("ul.list-unstyled li a")
@@ -22,7 +27,6 @@ unique_words = sorted(set(words))
 
 # Save to file or print
 with open("wordle_words.txt", "w") as f:
-    for word in unique_words:
-        f.write(word + "\n")
+    f.write("".join(word + "\n" for word in unique_words))
 
 print(f"Extracted {len(unique_words)} unique words.")